@@ -1,29 +1,65 @@
 import datetime
-from datetime import date, timedelta
+import heapq
+import itertools
+import re
+import sys
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date
 
 # -----------------------------
 # Helper functions
 # -----------------------------
 
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_INT_RE = re.compile(r"\s*\d+\s*")
+_FLOAT_RE = re.compile(r"\s*(\d+(\.\d*)?|\.\d+)\s*")
+
+
 def parse_date(date_str):
     """
     Parse a date in YYYY-MM-DD format.
     """
+    # fromisoformat also accepts forms like 20240101 or 2024-W01-1,
+    # so check the exact shape first
+    if _DATE_RE.fullmatch(date_str) is None:
+        print("Invalid date format. Please use YYYY-MM-DD.")
+        return None
+
     try:
-        year, month, day = map(int, date_str.split("-"))
-        return date(year, month, day)
-    except Exception:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        # Well-formed but not a real calendar date (e.g. 2024-02-30)
         print("Invalid date format. Please use YYYY-MM-DD.")
         return None
 
 
-def get_days_until_exam(exam_date):
+def _days_until(exam_ord, today_ord):
+    """
+    Return number of days from today until the exam, both given as date ordinals.
+    """
+    return max(exam_ord - today_ord, 0)
+
+
+@dataclass(slots=True)
+class Subjects:
     """
-    Return number of days from today until exam_date.
+    Subject details stored as parallel arrays; subject i is
+    names[i], exam_ords[i], weak[i] and priority[i].
     """
-    today = date.today()
-    delta = (exam_date - today).days
-    return max(delta, 0)
+    names: list[str] = field(default_factory=list)
+    exam_ords: array = field(default_factory=lambda: array("i"))
+    weak: array = field(default_factory=lambda: array("b"))
+    priority: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, exam_date, weak):
+        self.names.append(name)
+        self.exam_ords.append(exam_date.toordinal())
+        self.weak.append(weak)
 
 
 # -----------------------------
@@ -34,12 +70,14 @@ def collect_subject_info():
     print("Welcome to Study Buddy Agent 📚")
     print("Let's set up your subjects and exams.\n")
 
-    subjects = []
+    subjects = Subjects()
 
     while True:
         subject_name = input("Enter subject name (or press Enter to finish): ").strip()
         if subject_name == "":
             break
+        # Every plan block refers to this name, so keep one shared copy
+        subject_name = sys.intern(subject_name)
 
         exam_date_str = input(f"Enter exam date for {subject_name} (YYYY-MM-DD): ").strip()
         exam_date = parse_date(exam_date_str)
@@ -50,11 +88,7 @@ def collect_subject_info():
         is_weak_str = input(f"Is {subject_name} a weak subject for you? (yes/no): ").strip().lower()
         is_weak = is_weak_str in ["yes", "y"]
 
-        subjects.append({
-            "name": subject_name,
-            "exam_date": exam_date,
-            "weak": is_weak
-        })
+        subjects.add(subject_name, exam_date, is_weak)
 
     if not subjects:
         print("No subjects entered. Exiting.")
@@ -62,25 +96,27 @@ def collect_subject_info():
 
     # Daily study hours
     while True:
-        try:
-            daily_hours = float(input("\nHow many hours can you study per day? (e.g. 2): ").strip())
-            if daily_hours <= 0:
-                print("Please enter a positive number.")
-                continue
-            break
-        except ValueError:
+        hours_str = input("\nHow many hours can you study per day? (e.g. 2): ").strip()
+        if not _FLOAT_RE.fullmatch(hours_str):
             print("Please enter a valid number.")
+            continue
+        daily_hours = float(hours_str)
+        if daily_hours <= 0:
+            print("Please enter a positive number.")
+            continue
+        break
 
     # Duration of plan (days)
     while True:
-        try:
-            plan_days = int(input("For how many days do you want to generate a plan? (e.g. 7): ").strip())
-            if plan_days <= 0:
-                print("Please enter a positive integer.")
-                continue
-            break
-        except ValueError:
+        days_str = input("For how many days do you want to generate a plan? (e.g. 7): ").strip()
+        if not _INT_RE.fullmatch(days_str):
             print("Please enter a valid integer.")
+            continue
+        plan_days = int(days_str)
+        if plan_days <= 0:
+            print("Please enter a positive integer.")
+            continue
+        break
 
     return subjects, daily_hours, plan_days
 
@@ -89,17 +125,17 @@ def collect_subject_info():
 # Scheduling logic
 # -----------------------------
 
-def compute_priority(subject):
+def compute_priority(exam_ord, weak, today_ord):
     """
     Compute a priority score based on how close the exam is and whether it's weak.
     Higher score = more priority.
     """
-    days_until = get_days_until_exam(subject["exam_date"])
+    days_until = _days_until(exam_ord, today_ord)
 
     # Avoid division by zero
     days_factor = 1 / (days_until + 1)
 
-    weak_bonus = 0.5 if subject["weak"] else 0.0
+    weak_bonus = 0.5 if weak else 0.0
 
     return days_factor + weak_bonus
 
@@ -119,29 +155,39 @@ def generate_study_plan(subjects, daily_hours, plan_days):
         print("Daily hours less than 1. Setting blocks_per_day = 1.")
         blocks_per_day = 1
 
-    # Pre-calculate priorities
-    for subj in subjects:
-        subj["priority"] = compute_priority(subj)
+    today_ord = date.today().toordinal()
+
+    # Pre-calculate priorities in one pass
+    subjects.priority = array("d", (
+        compute_priority(exam_ord, weak, today_ord)
+        for exam_ord, weak in zip(subjects.exam_ords, subjects.weak)
+    ))
 
-    # Sort subjects by priority (high to low)
-    subjects_sorted = sorted(subjects, key=lambda x: x["priority"], reverse=True)
+    # Sort subject ids by priority (high to low), keeping input order on ties
+    order = sorted(range(len(subjects)), key=subjects.priority.__getitem__, reverse=True)
 
-    today = date.today()
     plan = []  # list of days; each day is dict {date, sessions: [subject names]}
 
-    for day_index in range(plan_days):
-        day_date = today + timedelta(days=day_index)
-        day_sessions = []
+    if len(order) == 1:
+        # Only one subject: every block of every day is the same
+        only_name = subjects.names[order[0]]
+        names = None
+    else:
+        # Simple round-robin by priority, continuing across days
+        names = itertools.cycle([subjects.names[i] for i in order])
 
-        # Simple round-robin by priority
-        for i in range(blocks_per_day):
-            subject = subjects_sorted[(day_index * blocks_per_day + i) % len(subjects_sorted)]
-            day_sessions.append(subject["name"])
+    for day_index in range(plan_days):
+        day_date = date.fromordinal(today_ord + day_index)
+        if names is None:
+            day_sessions = [only_name] * blocks_per_day
+        else:
+            day_sessions = list(itertools.islice(names, blocks_per_day))
 
         plan.append({
             "date": day_date,
             "sessions": day_sessions,
-            "completed": [False] * len(day_sessions)
+            "completed": bytearray(len(day_sessions)),
+            "free": len(day_sessions)  # blocks not yet marked completed
         })
 
     return plan
@@ -151,18 +197,45 @@ def generate_study_plan(subjects, daily_hours, plan_days):
 # Plan display and update
 # -----------------------------
 
-def display_day_plan(day_plan, day_number=None):
+def _append_day_lines(parts, day_plan, day_number=None):
     """
-    Print the plan for a single day.
+    Append the display lines for a single day to parts.
     """
     if day_number is not None:
-        print(f"\nDay {day_number + 1} - {day_plan['date']}:")
+        parts.append(f"\nDay {day_number + 1} - {day_plan['date']}:")
     else:
-        print(f"\nDate: {day_plan['date']}")
+        parts.append(f"\nDate: {day_plan['date']}")
 
+    completed = day_plan["completed"]
     for idx, subj in enumerate(day_plan["sessions"]):
-        status = "✅" if day_plan["completed"][idx] else "⬜"
-        print(f"  [{status}] Block {idx + 1}: {subj}")
+        status = "✅" if completed[idx] else "⬜"
+        parts.append(f"  [{status}] Block {idx + 1}: {subj}")
+
+
+def format_day_plan(day_plan, day_number=None):
+    """
+    Return the plan for a single day as printable text.
+    """
+    parts = []
+    _append_day_lines(parts, day_plan, day_number)
+    return "\n".join(parts)
+
+
+def format_plan(plan):
+    """
+    Return the full plan as printable text, joined once at the end.
+    """
+    parts = []
+    for i, day_plan in enumerate(plan):
+        _append_day_lines(parts, day_plan, i)
+    return "\n".join(parts)
+
+
+def display_day_plan(day_plan, day_number=None):
+    """
+    Print the plan for a single day.
+    """
+    print(format_day_plan(day_plan, day_number))
 
 
 def mark_day_progress(day_plan):
@@ -177,15 +250,18 @@ def mark_day_progress(day_plan):
         print("No updates made.")
         return day_plan
 
-    try:
-        indices = [int(x.strip()) - 1 for x in completed_str.split(",") if x.strip() != ""]
-        for idx in indices:
-            if 0 <= idx < len(day_plan["sessions"]):
-                day_plan["completed"][idx] = True
-            else:
-                print(f"Ignoring invalid block number: {idx + 1}")
-    except ValueError:
+    tokens = [x for x in completed_str.split(",") if x.strip() != ""]
+    if not all(_INT_RE.fullmatch(x) for x in tokens):
         print("Invalid input. No updates made.")
+        return day_plan
+
+    for idx in (int(x) - 1 for x in tokens):
+        if 0 <= idx < len(day_plan["sessions"]):
+            if not day_plan["completed"][idx]:
+                day_plan["completed"][idx] = 1
+                day_plan["free"] -= 1
+        else:
+            print(f"Ignoring invalid block number: {idx + 1}")
 
     return day_plan
 
@@ -195,11 +271,11 @@ def reschedule_incomplete_tasks(plan, current_day_index):
     Move incomplete tasks from current day to future days.
     """
     current_day = plan[current_day_index]
-    incomplete_subjects = [
+    incomplete_subjects = deque(
         current_day["sessions"][i]
         for i, done in enumerate(current_day["completed"])
         if not done
-    ]
+    )
 
     if not incomplete_subjects:
         print("Great! No incomplete tasks to reschedule.")
@@ -213,23 +289,31 @@ def reschedule_incomplete_tasks(plan, current_day_index):
         print("No future days in the plan. Tasks cannot be rescheduled.")
         return plan
 
-    idx = 0
-    for subj in incomplete_subjects:
+    # Min-heap of (day offset, free blocks left, block to search from),
+    # so days that fill up are never scanned again
+    heap = [
+        (i, day["free"], 0)
+        for i, day in enumerate(future_days)
+        if day["free"] > 0
+    ]
+    heapq.heapify(heap)
+
+    while incomplete_subjects:
         # place each incomplete subject in the earliest future day with free slot
-        placed = False
-        for day in future_days:
-            try:
-                # find first not-completed block and replace it
-                free_index = day["completed"].index(False)
-                day["sessions"][free_index] = subj
-                placed = True
-                break
-            except ValueError:
-                continue
-        if not placed:
+        subj = incomplete_subjects.popleft()
+        if not heap:
             print(f"Could not reschedule: {subj} (no free slots).")
+            continue
+
+        i, free, start = heapq.heappop(heap)
+        day = future_days[i]
 
-        idx += 1
+        # find next not-completed block and replace it
+        free_index = day["completed"].find(0, start)
+        day["sessions"][free_index] = subj
+
+        if free > 1:
+            heapq.heappush(heap, (i, free - 1, free_index + 1))
 
     print("Rescheduling done.")
     return plan
@@ -243,6 +327,45 @@ def main():
     subjects, daily_hours, plan_days = collect_subject_info()
     plan = generate_study_plan(subjects, daily_hours, plan_days)
 
+    # Menu handlers; a handler returns True to leave the menu loop
+    def view_all():
+        # Render the whole plan and write it out in one go
+        sys.stdout.write(format_plan(plan) + "\n")
+
+    def view_day():
+        day_str = input(f"Enter day number (1-{len(plan)}): ").strip()
+        if not _INT_RE.fullmatch(day_str):
+            print("Please enter a valid integer.")
+            return
+        day_num = int(day_str) - 1
+        if 0 <= day_num < len(plan):
+            display_day_plan(plan[day_num], day_num)
+        else:
+            print("Invalid day number.")
+
+    def mark_day():
+        nonlocal plan
+        day_str = input(f"Enter day number to update (1-{len(plan)}): ").strip()
+        if not _INT_RE.fullmatch(day_str):
+            print("Please enter a valid integer.")
+            return
+        day_num = int(day_str) - 1
+        if 0 <= day_num < len(plan):
+            display_day_plan(plan[day_num], day_num)
+            plan[day_num] = mark_day_progress(plan[day_num])
+            plan = reschedule_incomplete_tasks(plan, day_num)
+        else:
+            print("Invalid day number.")
+
+    def quit_menu():
+        print("Goodbye! Keep studying consistently 💪")
+        return True
+
+    def invalid():
+        print("Invalid choice. Please select 1–4.")
+
+    handlers = {"1": view_all, "2": view_day, "3": mark_day, "4": quit_menu}
+
     while True:
         print("\n----- Study Buddy Agent Menu -----")
         print("1. View full plan")
@@ -251,39 +374,9 @@ def main():
         print("4. Exit")
         choice = input("Enter your choice (1-4): ").strip()
 
-        if choice == "1":
-            for i, day_plan in enumerate(plan):
-                display_day_plan(day_plan, i)
-
-        elif choice == "2":
-            try:
-                day_num = int(input(f"Enter day number (1-{len(plan)}): ").strip()) - 1
-                if 0 <= day_num < len(plan):
-                    display_day_plan(plan[day_num], day_num)
-                else:
-                    print("Invalid day number.")
-            except ValueError:
-                print("Please enter a valid integer.")
-
-        elif choice == "3":
-            try:
-                day_num = int(input(f"Enter day number to update (1-{len(plan)}): ").strip()) - 1
-                if 0 <= day_num < len(plan):
-                    display_day_plan(plan[day_num], day_num)
-                    plan[day_num] = mark_day_progress(plan[day_num])
-                    plan = reschedule_incomplete_tasks(plan, day_num)
-                else:
-                    print("Invalid day number.")
-            except ValueError:
-                print("Please enter a valid integer.")
-
-        elif choice == "4":
-            print("Goodbye! Keep studying consistently 💪")
+        if handlers.get(choice, invalid)():
             break
 
-        else:
-            print("Invalid choice. Please select 1–4.")
-
 
 if __name__ == "__main__":
     main()
\ No newline at end of file